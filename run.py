@@ -1,42 +1,108 @@
 import sys
 import importlib.util
-import subprocess
 import os
+import hashlib
+from functools import lru_cache
 
-req_modules = ['tkinter', 'pytube', 'threading', 'time', 'os', 'webbrowser']
+MIN_PYTHON_VERSION = (3, 10)
+PIP_TIMEOUT = 900
+# Required modules and the pip package that provides each, or None if pip cannot install it.
+REQUIRED_MODULES = {
+    'tkinter': None,
+    'pytube': 'pytube',
+    'requests': 'requests',
+    'PIL': 'Pillow',
+    'threading': None,
+    'time': None,
+    'os': None,
+    'webbrowser': None,
+}
 missing_modules = []
 
-if sys.version_info < (3, 10):
-    print(f"Python version 3.10 is required to run p2p-chat.Your version is {sys.version}. Please update accordingly.")
-else:
-    for module in req_modules:
-        if not module in sys.modules and importlib.util.find_spec(module) == None:
+# Written after a successful check, so later starts can skip it while nothing has changed.
+DEPS_OK_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'yt2mp3mp4', 'deps_ok')
+DEPS_OK_KEY = hashlib.sha1(repr((sys.executable, sys.version, sorted(REQUIRED_MODULES.items()))).encode()).hexdigest()
+
+@lru_cache(maxsize=None)
+def is_installed(module: str) -> bool:
+    """
+    Checks whether the module is already imported or can be found on the import path.
+
+    Args:
+        module (str): Name of the module.
+    """
+    return module in sys.modules or importlib.util.find_spec(module) is not None
+
+def deps_checked() -> bool:
+    """
+    Checks whether the dependencies were already verified for this interpreter and module list.
+    """
+    try:
+        with open(DEPS_OK_PATH) as f:
+            return f.read() == DEPS_OK_KEY
+    except OSError:
+        return False
+
+def mark_deps_checked():
+    """
+    Records that the dependencies are installed for this interpreter and module list.
+    """
+    try:
+        os.makedirs(os.path.dirname(DEPS_OK_PATH), exist_ok=True)
+        with open(DEPS_OK_PATH, 'w') as f:
+            f.write(DEPS_OK_KEY)
+    except OSError:
+        pass
+
+if sys.version_info < MIN_PYTHON_VERSION:
+    print(f"Python version {'.'.join(map(str, MIN_PYTHON_VERSION))} is required to run yt2mp3mp4. Your version is {sys.version}. Please update accordingly.")
+elif not deps_checked():
+    # Collect the report and write it at once instead of one print per module.
+    report = []
+    for module in REQUIRED_MODULES:
+        if not is_installed(module):
             missing_modules.append(module)
-            print(f'Required module is not found: {module}')
+            report.append(f'Required module is not found: {module}')
         else:
-            print(f'Module is installed: {module}')
+            report.append(f'Module is installed: {module}')
 
     if missing_modules:
-        print("The following module/s is/are required:")
-        for module in missing_modules:
-            print(module)
+        report.append("The following module/s is/are required:")
+        report.extend(missing_modules)
+    print('\n'.join(report))
+
+    pip_names = [REQUIRED_MODULES[module] for module in missing_modules if REQUIRED_MODULES[module]]
+    if pip_names:
         install = input("Install the missing modules with pip? (Y/n) ")
         if install == 'y' or install == 'Y':
-            for module in missing_modules:
-                try:
-                    pip = subprocess.Popen([sys.executable, '-m', 'pip', 'install', 'module'])
-                    pip.wait()
-                except Exception as e:
-                    pass
-                if not module in sys.modules and importlib.util.find_spec(module) == None:
+            # Only needed when installing, so it is not imported on every start.
+            import subprocess
+
+            # A single pip run resolves and downloads every missing module together.
+            try:
+                pip = subprocess.run([sys.executable, '-m', 'pip', 'install', *pip_names], timeout=PIP_TIMEOUT)
+                # pip installs nothing if any one package fails to resolve, so retry them one by one.
+                if pip.returncode != 0 and len(pip_names) > 1:
+                    for pip_name in pip_names:
+                        subprocess.run([sys.executable, '-m', 'pip', 'install', pip_name], timeout=PIP_TIMEOUT)
+            except Exception as e:
+                pass
+            # Forget earlier results so freshly installed modules are found.
+            is_installed.cache_clear()
+            importlib.invalidate_caches()
+            for module in list(missing_modules):
+                if not is_installed(module):
                     print(f'Failed to install: {module}')
                 else:
                     print(f'Installed: {module}')
                     missing_modules.remove(module)
 
+    if not missing_modules:
+        mark_deps_checked()
+
 if missing_modules:
     print("Install these modules manually:")
-    for module in missing_modules: print(module)
+    for module in missing_modules: print(REQUIRED_MODULES[module] or module)
     os.sys('pause')
 else:
     import yt2mp3
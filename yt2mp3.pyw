@@ -1,13 +1,99 @@
-from pytube import YouTube
-from pytube import Playlist
 from tkinter import filedialog, BooleanVar, ttk, messagebox
-from threading import Thread
-from PIL import Image, ImageTk
+from threading import Lock, get_ident
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
-import urllib.request
+from collections import OrderedDict
+from typing import NamedTuple
 import time
 import tkinter as tk
-import os, webbrowser
+import os, sys
+from urllib.parse import parse_qs, urlsplit
+import shelve
+import dbm.dumb
+import re
+
+# Prints diagnostic output to the console when enabled.
+DEBUG = False
+
+# Layout settings
+HEADER_FONT = ('Helvetica', 12, 'bold')
+STATUS_FONT = ('Helvetica', 10)
+THUMBNAIL_SIZE = (400, 200)
+# Name of the PIL resampling filter; resolved once PIL is imported. Image.BILINEAR exists on every
+# Pillow version, unlike Image.Resampling (9.1+).
+THUMBNAIL_RESAMPLE = 'BILINEAR'
+THUMBNAIL_TIMEOUT = 10
+
+# Output modes
+MODES = ('mp3', 'mp4')
+
+# Widget states, keyed by change_widgets() mode.
+WIDGET_STATES = {'on': 'normal', 'off': 'disabled'}
+
+# Download status messages, indexed by state.
+DOWNLOAD_STATUS_MESSAGES = ('Downloading {}', 'Downloaded @ {}', 'File exists @ {}')
+
+# Links that can name a YouTube video or playlist; anything else is rejected before pytube parses it.
+YOUTUBE_URL_RE = re.compile(r'^(?:https?://)?(?:www\.|m\.|music\.)?(?:youtube\.com|youtube-nocookie\.com|youtu\.be)/', re.IGNORECASE)
+
+# Characters pytube strips from titles when naming downloaded files.
+ILLEGAL_FILENAME_CHARS = ''.join(map(chr, range(31))) + '"#$%\'*,./:;<>?\\^|~'
+ILLEGAL_FILENAME_TABLE = str.maketrans('', '', ILLEGAL_FILENAME_CHARS)
+
+# Cache settings
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'yt2mp3mp4')
+SIZE_CACHE_TTL = 24 * 60 * 60
+SIZE_CACHE_LIMIT = 1024
+SIZE_CACHE_PRUNE = SIZE_CACHE_LIMIT // 10
+SIZE_MEMO_LIMIT = 256
+LINK_CACHE_TTL = 60 * 60
+LINK_CACHE_LIMIT = 8
+THUMBNAIL_CACHE_LIMIT = 8
+THUMBNAIL_CACHE_DIR = os.path.join(CACHE_DIR, 'thumbs')
+THUMBNAIL_DISK_LIMIT = 256
+THUMBNAIL_DISK_PRUNE = THUMBNAIL_DISK_LIMIT // 10
+THUMBNAIL_QUALITY = 82
+
+# Minimum interval between batches of widget updates from worker threads.
+UI_REFRESH_MS = 33
+
+# Delay after the last edit of the link before it is looked up.
+LINK_DEBOUNCE_MS = 300
+
+# Delay before the download status is cleared after a conversion.
+STATUS_RESET_MS = 5000
+
+# Concurrency settings
+MAX_CONCURRENT_TASKS = 4
+MAX_CONCURRENT_ESTIMATES = min(32, (os.cpu_count() or 1) + 4)
+
+class CachedSize(NamedTuple):
+    """
+    File size cache entry. The shelve stores it as a plain tuple so it unpickles no matter
+    which module name this file was loaded under.
+    """
+    stored_at: float
+    size: float
+
+def debug(message: str, *args) -> None:
+    """
+    Prints a diagnostic message when DEBUG is enabled. The message is only formatted when printed.
+
+    Args:
+        message (str): %-style format string.
+        *args: Values for the format string.
+    """
+    if DEBUG:
+        print(message % args)
+
+def sanitize_filename(title: str) -> str:
+    """
+    Returns the file name pytube uses for the given title, without the extension.
+
+    Args:
+        title (str): Title of the video.
+    """
+    return title.translate(ILLEGAL_FILENAME_TABLE)[:255]
 
 class GUI:
     def __init__(self) -> None:
@@ -18,6 +104,8 @@ class GUI:
         self.version = '1.2.0'
         # Initializes the window.
         self.window = tk.Tk()
+        # Stay hidden until the widgets are laid out, so the layout is computed in one pass.
+        self.window.withdraw()
         self.window.title(f"Youtube to MP3/MP4 V{self.version}")
         self.window.minsize(550, 200)
 
@@ -25,36 +113,96 @@ class GUI:
         self.in_link_entry = tk.StringVar()
         self.photo = None
 
+        # Widget updates queued by worker threads, applied together on the main thread.
+        self.pending_ui = {}
+        self.pending_ui_lock = Lock()
+        self.ui_drain_scheduled = False
+        self.applied_ui = {}
+
+        # Pending link lookup and the number of the latest one.
+        self.link_after_id = None
+        self.link_request = 0
+
+        # Pending reset of the status labels after a conversion.
+        self.status_reset_id = None
+
+        # Recently used link objects, keyed by video ID (or playlist URL), so repeated
+        # lookups and the conversion reuse what pytube has already fetched.
+        self.link_cache = OrderedDict()
+        self.link_cache_lock = Lock()
+
+        # Recently rendered thumbnails, keyed by video ID.
+        self.thumbnail_cache = OrderedDict()
+        self.thumbnail_cache_lock = Lock()
+        self.thumbnail_resample = None
+
+        # Keep-alive HTTP session, so repeated thumbnail fetches reuse the connection to YouTube's image host.
+        self.http_session = None
+        self.http_session_lock = Lock()
+
+        # Preferred streams of the most recently indexed video.
+        self.stream_index = (None, {})
+
+        # Workers for link lookups. File size lookups get their own pool because link lookups wait on them.
+        self.task_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TASKS, thread_name_prefix='yt2mp3')
+        self.link_future = None
+
+        # Workers for file size lookups, shared across videos.
+        self.size_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_ESTIMATES, thread_name_prefix='yt2mp3-size')
+
+        # A single worker for conversions, so stuck link lookups can never starve one and only one runs at a time.
+        self.convert_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='yt2mp3-convert')
+
         # Boolean variables
         self.is_vid = True
         self.is_mp3 = BooleanVar(value=True)
+        self.open_folder = BooleanVar(value=True)
+
+        # File size cache, persisted across sessions, with an in-memory LRU of the most recently used entries.
+        self.size_cache_lock = Lock()
+        self.size_memo = OrderedDict()
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            # The shelf is used from worker threads, so it needs a backend that is not tied to the
+            # thread that opened it. Since Python 3.13 shelve.open() defaults to dbm.sqlite3, whose
+            # connection only works in its creating thread; dbm.dumb has no such restriction.
+            self.size_cache = shelve.Shelf(dbm.dumb.open(os.path.join(CACHE_DIR, 'sizes')))
+        except OSError:
+            self.size_cache = {}
 
         # Labels
-        self.link = tk.Label(self.window, text="YouTube Link:", font=('Helvetica', 12, 'bold'))
-        self.selection = tk.Label(self.window, text="Preferred Output", font=('Helvetica', 12, 'bold'))
-        self.directory = tk.Label(self.window, text="Directory", font=('Helvetica', 12, 'bold'))
-        self.status_text = tk.Label(self.window, text="Idle", font=('Helvetica', 12, 'bold'))
-        self.download_status = tk.Label(self.window, font=('Helvetica', 10), wraplength=250)
-        self.video_title = tk.Label(self.window, text="YouTube Video Title", font=('Helvetica', 12, 'bold'))
-        self.file_size = tk.Label(self.window, font=('Helvetica', 12, 'bold'))
+        self.link = tk.Label(self.window, text="YouTube Link:", font=HEADER_FONT)
+        self.selection = tk.Label(self.window, text="Preferred Output", font=HEADER_FONT)
+        self.directory = tk.Label(self.window, text="Directory", font=HEADER_FONT)
+        self.status_text = tk.Label(self.window, text="Idle", font=HEADER_FONT)
+        self.download_status = tk.Label(self.window, font=STATUS_FONT, wraplength=250)
+        self.video_title = tk.Label(self.window, text="YouTube Video Title", font=HEADER_FONT)
+        self.file_size = tk.Label(self.window, font=HEADER_FONT)
 
         # Text boxes
         self.in_link = tk.Entry(self.window, textvariable=self.in_link_entry, width=40)
         self.in_directory = tk.Entry(self.window, width=40)
 
         # Radio Buttons
-        self.mp3_butt = tk.Radiobutton(self.window, text="MP3", variable=self.is_mp3, value = True, font=('Helvetica', 12, 'bold'))
-        self.mp4_butt = tk.Radiobutton(self.window, text="MP4", variable=self.is_mp3, value = False, font=('Helvetica', 12, 'bold'))
+        self.mp3_butt = tk.Radiobutton(self.window, text="MP3", variable=self.is_mp3, value = True, font=HEADER_FONT)
+        self.mp4_butt = tk.Radiobutton(self.window, text="MP4", variable=self.is_mp3, value = False, font=HEADER_FONT)
+
+        # Check Buttons
+        self.open_folder_butt = tk.Checkbutton(self.window, text="Open folder when done", variable=self.open_folder, font=STATUS_FONT)
 
         # Normal Buttons
-        self.browse = tk.Button(self.window, text="Browse", command=self.get_dir, font=('Helvetica', 12, 'bold'))
-        self.convert = tk.Button(self.window, text="Convert", command = self.start_convert, font=('Helvetica', 12, 'bold'))
+        self.browse = tk.Button(self.window, text="Browse", command=self.get_dir, font=HEADER_FONT)
+        self.convert = tk.Button(self.window, text="Convert", command = self.start_convert, font=HEADER_FONT)
+
+        # Widgets that are disabled while converting.
+        self.to_change_state = (self.in_link, self.in_directory, self.mp3_butt, self.mp4_butt, self.browse, self.convert)
 
         # Progress Bar
         self.pb = ttk.Progressbar(self.window, orient="horizontal", mode='indeterminate', length=250)
 
         # Canvas Image
-        self.thumbnail = tk.Canvas(self.window, width=400, height=200)
+        self.thumbnail = tk.Canvas(self.window, width=THUMBNAIL_SIZE[0], height=THUMBNAIL_SIZE[1])
+        self.thumbnail_image = self.thumbnail.create_image(1, 1, anchor='nw')
 
         #* Grid Settings
         # Row 0
@@ -80,6 +228,7 @@ class GUI:
 
         # Row 5
         self.convert.grid(row=5,columnspan=2,padx=5,pady=5)
+        self.open_folder_butt.grid(row=5, column=2)
 
         # Row 6
         self.pb.grid(row=6,column=0,padx=5,pady=5)
@@ -89,7 +238,12 @@ class GUI:
         self.download_status.grid(row=7,columnspan=2,pady=1)
 
         # Initial threads
-        self.in_link_entry.trace_add('write', callback=self.start_wait_link_thread)
+        self.in_link_entry.trace_add('write', callback=self.schedule_wait_link)
+        self.in_link.bind('<Return>', self.flush_wait_link)
+
+        # Show the window once, fully laid out.
+        self.window.update_idletasks()
+        self.window.deiconify()
 
     def get_thumbnail(self, yt_object):
         """
@@ -98,19 +252,123 @@ class GUI:
         Args:
             yt_object (YouTube/Playlist): YouTube or Playlist object from Pytube.
         """
-        open_url = urllib.request.urlopen(yt_object.thumbnail_url)
-        raw_data = open_url.read()
+        # PIL is imported on first use so it does not delay the window at startup.
+        from PIL import Image, ImageTk
+        if self.thumbnail_resample is None:
+            self.thumbnail_resample = getattr(Image, THUMBNAIL_RESAMPLE)
 
+        video_id = yt_object.video_id
+        with self.thumbnail_cache_lock:
+            photo = self.thumbnail_cache.get(video_id)
+            if photo is not None:
+                self.thumbnail_cache.move_to_end(video_id)
+                return photo
 
-        im = Image.open(BytesIO(raw_data))
-        im = im.resize((400, 200))
-        return ImageTk.PhotoImage(im)
+        # Resized thumbnails are also kept on disk, so they survive restarts and skip the download.
+        path = os.path.join(THUMBNAIL_CACHE_DIR, f'{video_id}.jpg')
+        try:
+            with Image.open(path) as im:
+                im.load()
+            # Mark it as recently used, so pruning the disk cache keeps it.
+            os.utime(path)
+        except OSError:
+            response = self.get_http_session().get(yt_object.thumbnail_url, timeout=THUMBNAIL_TIMEOUT)
+            response.raise_for_status()
+            raw_data = response.content
+
+            im = Image.open(BytesIO(raw_data))
+            # Let the JPEG decoder scale down while decoding; it stays at least THUMBNAIL_SIZE.
+            im.draft('RGB', THUMBNAIL_SIZE)
+            im = im.resize(THUMBNAIL_SIZE, self.thumbnail_resample)
+            self.save_thumbnail(im, path)
+        photo = ImageTk.PhotoImage(im)
+
+        with self.thumbnail_cache_lock:
+            self.thumbnail_cache[video_id] = photo
+            if len(self.thumbnail_cache) > THUMBNAIL_CACHE_LIMIT:
+                self.thumbnail_cache.popitem(last=False)
+        return photo
+
+    def get_http_session(self):
+        """
+        Returns the shared HTTP session. It is created on first use, so requests is not imported at startup.
+        """
+        with self.http_session_lock:
+            if self.http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self.http_session = requests.Session()
+                self.http_session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_TASKS, max_retries=1))
+            return self.http_session
+
+    def save_thumbnail(self, im, path: str):
+        """
+        Writes the resized thumbnail to the disk cache. Once the cache holds more than
+        THUMBNAIL_DISK_LIMIT thumbnails, the least recently used ones are removed until
+        THUMBNAIL_DISK_PRUNE slots are free. Failures only cost a later download, so they are ignored.
+
+        Args:
+            im (Image.Image): Resized thumbnail.
+            path (str): Cache path of the thumbnail.
+        """
+        # The same video can be looked up by two threads, so each writes its own file and swaps it in.
+        temp = f'{path}.{get_ident()}.tmp'
+        try:
+            os.makedirs(THUMBNAIL_CACHE_DIR, exist_ok=True)
+            try:
+                im.convert('RGB').save(temp, 'JPEG', quality=THUMBNAIL_QUALITY)
+                os.replace(temp, path)
+            except:
+                if os.path.exists(temp):
+                    os.remove(temp)
+                raise
+
+            with os.scandir(THUMBNAIL_CACHE_DIR) as entries:
+                thumbnails = [entry for entry in entries if entry.name.endswith('.jpg')]
+            if len(thumbnails) > THUMBNAIL_DISK_LIMIT:
+                thumbnails.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in thumbnails[:len(thumbnails) - THUMBNAIL_DISK_LIMIT + THUMBNAIL_DISK_PRUNE]:
+                    os.remove(entry.path)
+        except OSError:
+            pass
+
+    def schedule_wait_link(self, *args):
+        """
+        Schedules the link lookup, replacing any lookup still pending so that only the
+        final edit of the link starts a thread.
+        """
+        if self.link_after_id is not None:
+            self.window.after_cancel(self.link_after_id)
+        self.link_after_id = self.window.after(LINK_DEBOUNCE_MS, self.start_wait_link_thread)
+
+    def flush_wait_link(self, *args):
+        """
+        Starts the pending link lookup right away, without waiting out the debounce delay.
+        """
+        if self.link_after_id is not None:
+            self.window.after_cancel(self.link_after_id)
+            self.start_wait_link_thread()
 
     def start_wait_link_thread(self, *args):
         """
         Starts the thread for capturing events in the entry for YouTube links.
         """
-        Thread(target=self.wait_link, args=(self.get_input_link(),)).start()
+        self.link_after_id = None
+        self.link_request += 1
+        # A lookup that has not started yet is superseded by this one.
+        if self.link_future is not None:
+            self.link_future.cancel()
+        self.link_future = self.task_pool.submit(self.wait_link, self.get_input_link(), self.link_request)
+
+    def is_stale(self, request: int) -> bool:
+        """
+        Checks whether a newer link has been entered since the given link request.
+
+        Args:
+            request (int): Link request number, or None for lookups that are never superseded.
+        """
+        return request is not None and request != self.link_request
 
     def get_file_size(self, link, mode: str):
         """
@@ -120,54 +378,205 @@ class GUI:
             object (YouTube/Playlist): YouTube or Playlist object from pytube.
             mode (str): mp3 or mp4
         """
+        cached = self.get_cached_size(link.video_id, mode)
+        if cached is not None:
+            return cached
         try:
-            if mode == 'mp3':
-                return round(int(self.object_filter(link, mode).filesize) / 1000000, 2)
-            elif mode == 'mp4':
-                return round(int(self.object_filter(link, mode).filesize) / 1000000, 2)
-            else: raise ValueError
+            if mode not in MODES: raise ValueError
+            size = round(self.object_filter(link, mode).filesize / 1000000, 2)
         except ValueError:
-            messagebox.showerror("get_file_size() only accepts mp3 or mp4 as arguments for the mode.")
+            self.show_error("get_file_size() only accepts mp3 or mp4 as arguments for the mode.")
+            return
+        self.cache_size(link.video_id, mode, size)
+        return size
+
+    def get_file_sizes(self, link, modes):
+        """
+        Returns the file sizes of the video for several modes, fetched concurrently.
+
+        Args:
+            link (YouTube): YouTube object from pytube.
+            modes (tuple): Modes to fetch, each either 'mp3' or 'mp4'.
+        """
+        # Skip the stream manifest entirely when every size is already cached.
+        cached = {mode: self.get_cached_size(link.video_id, mode) for mode in modes}
+        if None not in cached.values():
+            return cached
+
+        # Index the streams once so the workers do not race to fetch them.
+        self.index_streams(link)
+        sizes = self.size_pool.map(lambda mode: self.get_file_size(link, mode), modes)
+        return dict(zip(modes, sizes))
+
+    def get_cached_size(self, video_id: str, mode: str):
+        """
+        Returns the cached file size of the video, or None if it is missing or expired.
+
+        Args:
+            video_id (str): YouTube video ID.
+            mode (str): mp3 or mp4
+        """
+        key = f'{video_id}:{mode}'
+        with self.size_cache_lock:
+            entry = self.size_memo.get(key)
+            if entry is None:
+                stored = self.size_cache.get(key)
+                if stored is None:
+                    return None
+                entry = self.remember_size(key, CachedSize(*stored))
+            else:
+                self.size_memo.move_to_end(key)
+            if time.time() - entry.stored_at > SIZE_CACHE_TTL:
+                del self.size_memo[key]
+                self.size_cache.pop(key, None)
+                return None
+            return entry.size
+
+    def cache_size(self, video_id: str, mode: str, size: float):
+        """
+        Stores the file size of the video, pruning the cache first when it is full.
+
+        Args:
+            video_id (str): YouTube video ID.
+            mode (str): mp3 or mp4
+            size (float): File size in MB.
+        """
+        with self.size_cache_lock:
+            if len(self.size_cache) >= SIZE_CACHE_LIMIT:
+                self.prune_size_cache()
+            key = f'{video_id}:{mode}'
+            entry = self.remember_size(key, CachedSize(time.time(), size))
+            self.size_cache[key] = tuple(entry)
+
+    def remember_size(self, key: str, entry: CachedSize) -> CachedSize:
+        """
+        Adds an entry to the in-memory size LRU, dropping the least recently used one when full.
+        Must be called with the size cache lock held.
+
+        Args:
+            key (str): Cache key of the entry.
+            entry (CachedSize): Entry to remember.
+        """
+        self.size_memo[key] = entry
+        self.size_memo.move_to_end(key)
+        if len(self.size_memo) > SIZE_MEMO_LIMIT:
+            self.size_memo.popitem(last=False)
+        return entry
+
+    def prune_size_cache(self):
+        """
+        Removes every expired entry, and the oldest ones until SIZE_CACHE_PRUNE entries are free.
+        Reading the whole shelf is slow, so this is done in one pass that frees room for many inserts.
+        Must be called with the size cache lock held.
+        """
+        now = time.time()
+        entries = sorted((self.size_cache[key][0], key) for key in self.size_cache)
+        expired = sum(1 for stored_at, _ in entries if now - stored_at > SIZE_CACHE_TTL)
+        excess = max(expired, len(entries) - (SIZE_CACHE_LIMIT - SIZE_CACHE_PRUNE))
+        for _, key in entries[:excess]:
+            del self.size_cache[key]
+            self.size_memo.pop(key, None)
+
+    def schedule_ui_update(self, widget, **options):
+        """
+        Queues widget options from any thread. Queued options are merged per widget, the latest
+        value winning, and applied on the main thread in one batch every UI_REFRESH_MS.
+
+        Args:
+            widget (tk.Widget): Widget to configure.
+            **options: Options passed to the widget's config().
+        """
+        with self.pending_ui_lock:
+            self.pending_ui.setdefault(widget, {}).update(options)
+            if self.ui_drain_scheduled:
+                return
+            self.ui_drain_scheduled = True
+        self.window.after(UI_REFRESH_MS, self.drain_ui_queue)
+
+    def drain_ui_queue(self):
+        """
+        Applies every queued widget update.
+        """
+        with self.pending_ui_lock:
+            pending, self.pending_ui = self.pending_ui, {}
+            self.ui_drain_scheduled = False
+        for widget, options in pending.items():
+            # Skip options that already hold the queued value; config() would still redraw.
+            applied = self.applied_ui.setdefault(widget, {})
+            changed = {key: value for key, value in options.items() if key not in applied or applied[key] != value}
+            if changed:
+                widget.config(**changed)
+                applied.update(changed)
 
     def reset_video_info_panel(self):
         """
         Resets the video info panel widgets.
         """
-        self.video_title.config(text="YouTube Video Title")
-        self.photo = None
-        self.file_size.config(text = '')
-        self.thumbnail.delete('all')
+        self.schedule_ui_update(self.video_title, text="YouTube Video Title")
+        self.schedule_ui_update(self.file_size, text='')
+        self.window.after(0, self.show_thumbnail, None)
 
-    def wait_link(self, youtube_object):
+    def show_thumbnail(self, photo, request: int = None):
+        """
+        Shows the thumbnail on the canvas, or clears it if there is none. Runs on the main thread.
+
+        Args:
+            photo (ImageTk.PhotoImage): Thumbnail to show, or None to clear the canvas.
+            request (int): Link request number. The thumbnail is dropped once a newer link is entered.
+        """
+        if self.is_stale(request): return
+        self.photo = photo
+        self.thumbnail.itemconfig(self.thumbnail_image, image=photo or '')
+
+    def wait_link(self, youtube_object, request: int = None):
         """
         Updates the video panel with the video's title, thumbnail, and file size.
 
         Args:
             youtube_object (YouTube/Playlist): YouTube or Playlist object from pytube.
+            request (int): Link request number. Results are dropped once a newer link is entered.
         """
+        from pytube import YouTube
+
+        # Invalid links and playlists have no video panel; reset without raising.
+        if not isinstance(youtube_object, YouTube):
+            self.reset_video_info_panel()
+            return
         try:
-            self.video_title.config(text=youtube_object.streams[0].title)
-            self.photo = self.get_thumbnail(youtube_object)
-            self.thumbnail.create_image(1, 1, image=self.photo, anchor='nw')
-            self.file_size.config(text=f"Filesize: {self.get_file_size(youtube_object, 'mp3')}MB (MP3) and {self.get_file_size(youtube_object, 'mp4')}MB (MP4)")
+            # The title comes from the player response, so showing it does not need the stream manifest.
+            title = youtube_object.title
+            if self.is_stale(request): return
+            self.schedule_ui_update(self.video_title, text=title)
+            photo = self.get_thumbnail(youtube_object)
+            if self.is_stale(request): return
+            self.window.after(0, self.show_thumbnail, photo, request)
+            sizes = self.get_file_sizes(youtube_object, MODES)
+            if self.is_stale(request): return
+            self.schedule_ui_update(self.file_size, text=f"Filesize: {sizes['mp3']}MB (MP3) and {sizes['mp4']}MB (MP4)")
 
         except:
-            self.reset_video_info_panel()
+            if not self.is_stale(request):
+                self.reset_video_info_panel()
 
     def start_convert(self):
         """
-        Starts the conversion process thread.
+        Locks the widgets and starts the conversion process thread. The widgets are locked
+        before the task is queued, so further clicks cannot queue another conversion.
         """
-        Thread(target=self.convert_now).start()
+        link = self.get_input_link()
+        type = 'vid' if self.is_vid else 'playlist'
+        self.begin_conversion_ui()
+        self.convert_pool.submit(self.convert_now, link, type, self.in_directory.get(), self.is_mp3.get())
 
-    def check_in_link(self):
+    def check_in_link(self, url: str):
         """
         Checks the input link whether it is under a playlist or not.
+
+        Args:
+            url (str): The input link.
         """
-        if 'list' in self.in_link.get():
-            self.is_vid = False
-        else: 
-            self.is_vid = True
+        # Only a real ``list`` query parameter marks a playlist, not any URL containing 'list'
+        self.is_vid = 'list' not in parse_qs(urlsplit(url).query)
 
     def change_widgets(self, mode: str) -> None:
         """
@@ -176,30 +585,58 @@ class GUI:
             mode (str): Takes in either the arguments 'on' or 'off' to state the mode of the widgets.
         """
         try:
-            if mode == 'on':
-                state = 'normal'
-            elif mode == 'off':
-                state = 'disabled'
-            else: raise ValueError
-        except ValueError:
+            state = WIDGET_STATES[mode]
+        except KeyError:
             messagebox.showerror(f'change_widgets() only takes in either on or off as arguments!')
+            return
 
-        to_change_state = [self.in_link, self.in_directory, self.mp3_butt, self.mp4_butt, self.browse, self.convert]
-        for variables in to_change_state:
-            variables.config(state=state)
+        for variables in self.to_change_state:
+            self.schedule_ui_update(variables, state=state)
 
     def get_input_link(self):
         """
         Gets the input link data. Returns a Youtube or Playlist object.
         """
-        self.check_in_link()
+        url = self.in_link.get().strip()
+        if not YOUTUBE_URL_RE.match(url):
+            return None
+        from pytube.exceptions import PytubeError
+        self.check_in_link(url)
         try:
-            
-            if self.is_vid:
-                return YouTube(self.in_link.get())
-            else:
-                return Playlist(self.in_link.get())
-        except: pass
+            return self.get_link(url, self.is_vid)
+        except PytubeError:
+            return None
+
+    def get_link(self, url: str, is_vid: bool):
+        """
+        Returns the YouTube or Playlist object for the link, reusing a recent one if possible.
+
+        Args:
+            url (str): Link of the video or playlist.
+            is_vid (bool): Whether the link is a video rather than a playlist.
+        """
+        # pytube is imported on first use so it does not delay the window at startup.
+        from pytube import YouTube, Playlist, extract
+
+        key = extract.video_id(url) if is_vid else url
+        with self.link_cache_lock:
+            entry = self.link_cache.get(key)
+            # Stream URLs expire, so old link objects are rebuilt.
+            if entry is not None and time.time() - entry[0] <= LINK_CACHE_TTL:
+                self.link_cache.move_to_end(key)
+                return entry[1]
+
+        if is_vid:
+            link = YouTube(url)
+        else:
+            link = Playlist(url)
+
+        with self.link_cache_lock:
+            self.link_cache[key] = (time.time(), link)
+            self.link_cache.move_to_end(key)
+            if len(self.link_cache) > LINK_CACHE_LIMIT:
+                self.link_cache.popitem(last=False)
+        return link
 
     def download_status_update(self, state: int, string: str):
         """
@@ -210,14 +647,9 @@ class GUI:
             string (str): title/directory of the video or audio file.
         """
         try:
-            if state == 0:
-                self.download_status.config(text=f'Downloading {string}')
-            elif state == 1:
-                self.download_status.config(text=f'Downloaded @ {string}')
-            elif state == 2:
-                self.download_status.config(text=f'File exists @ {string}')
-            else: 
+            if state not in range(len(DOWNLOAD_STATUS_MESSAGES)):
                 raise ValueError
+            self.schedule_ui_update(self.download_status, text=DOWNLOAD_STATUS_MESSAGES[state].format(string))
         except ValueError:
             print('download_status_update() only takes in 0-2 for the state!')
 
@@ -231,17 +663,19 @@ class GUI:
             mode (str): Accepts 'mp3' or 'mp4'
         """
         # Check if file exists before downloading
-        to_check = f'{directory}\\{streams_object.title}.{mode}'
-        print(to_check, "exists", os.path.isfile(to_check))
-        if os.path.isfile(to_check):
+        to_check = os.path.join(directory, f'{sanitize_filename(streams_object.title)}.{mode}')
+        exists = os.path.isfile(to_check)
+        debug('%s exists %s', to_check, exists)
+        if exists:
             self.download_status_update(2, streams_object.title)
         else:
             self.download_status_update(0, streams_object.title)
-            temp = streams_object.download(output_path=directory)
+            # Existence was checked above; skip pytube's own isfile/getsize probe
+            temp = streams_object.download(output_path=directory, skip_existing=False)
             base, _ = os.path.splitext(temp)
             output = base + '.' + mode
             if mode == 'mp3': 
-                os.rename(temp, output)
+                os.replace(temp, output)
             self.download_status_update(1, output)
 
     def object_filter(self, link, mode: str) -> None:
@@ -253,13 +687,42 @@ class GUI:
             mode (str): mp4 or mp3.
         """
         try:
-            if mode == 'mp3':
-                return link.streams.filter(adaptive=True, only_audio=True).order_by('abr').desc().first()
-            elif mode == 'mp4':
-                return link.streams.filter(progressive=True, file_extension='mp4').order_by('resolution').desc().first()
-            else: raise ValueError
+            if mode not in MODES: raise ValueError
+            return self.index_streams(link).get(mode)
         except ValueError:
-            messagebox.showerror("Value Error!", "object_filter() takes in only mp3 or mp4 for the mode.")
+            self.show_error("Value Error!", "object_filter() takes in only mp3 or mp4 for the mode.")
+
+    def index_streams(self, link) -> dict:
+        """
+        Returns the preferred stream for each mode, found in a single pass over the streams.
+        MP3 uses the audio-only adaptive stream with the highest bitrate, MP4 the progressive
+        mp4 stream with the highest resolution.
+
+        Args:
+            link (YouTube): YouTube object from pytube.
+        """
+        indexed_link, index = self.stream_index
+        if indexed_link is link:
+            return index
+
+        index, best_rank = {}, {}
+        for stream in link.streams:
+            if stream.is_adaptive and stream.includes_audio_track and not stream.includes_video_track:
+                mode, rank = 'mp3', stream.abr
+            elif stream.is_progressive and stream.subtype == 'mp4':
+                mode, rank = 'mp4', stream.resolution
+            else:
+                continue
+            if rank is None:
+                continue
+            rank = int(''.join(filter(str.isdigit, rank)))
+            # Ties go to the later stream, matching order_by().desc().first().
+            if rank >= best_rank.get(mode, -1):
+                best_rank[mode] = rank
+                index[mode] = stream
+
+        self.stream_index = (link, index)
+        return index
 
     def start_download(self, link, type: str, directory: str, is_mp3: bool):
         """
@@ -278,60 +741,106 @@ class GUI:
             if type == 'vid':
                 streams_object_mp3 = self.object_filter(link, mode)
                 self.download_file(streams_object_mp3, directory, mode)
-                self.window.update()
             elif type == 'playlist':
-                for video in link.videos:
+                for video_url in link.video_urls:
+                    video = self.get_link(video_url, True)
                     playlist_object_mp3 = self.object_filter(video, mode)
-                    Thread(target=self.wait_link, args=(video,)).start()
+                    self.task_pool.submit(self.wait_link, video)
                     self.download_file(playlist_object_mp3, directory, 'mp3')
-                    self.window.update()
 
         except Exception as e:
-            messagebox.showerror("YT Streams Error!", str(e))
-    def convert_now(self):
+            self.show_error("YT Streams Error!", str(e))
+
+    def show_error(self, title: str, message: str = None):
         """
-        Converts the YouTube link provided into either MP3 or MP4.
+        Shows an error dialog on the main thread, so that worker threads never block on it.
+
+        Args:
+            title (str): Title of the dialog.
+            message (str): Error message.
         """
-        # Start the progress bar.
-        self.pb.start()
+        self.window.after(0, messagebox.showerror, title, message)
 
-        # Adjust initial window.
-        self.status_text.config(text="Converting...")
-        self.change_widgets('off')
+    def convert_now(self, link, type: str, directory: str, is_mp3: bool):
+        """
+        Converts the YouTube link provided into either MP3 or MP4. Runs on a worker thread.
 
-        # Capture directory
-        directory = self.in_directory.get()
-        
-        if self.is_vid:
-            yt_link = self.get_input_link()
-            self.start_download(yt_link, 'vid', directory, self.is_mp3.get())
-        else:
-            playlist_link = self.get_input_link()
-            self.start_download(playlist_link, 'playlist', directory, self.is_mp3.get())
+        Args:
+            link (Youtube/Playlist): YouTube or Playlist Object from link.
+            type (str): Accepts either 'vid' or 'playlist'.
+            directory (str): The directory to save.
+            is_mp3 (bool): Checks if the object will be converted to mp3 or mp4.
+        """
+        self.start_download(link, type, directory, is_mp3)
 
         # Done
-        self.change_widgets('on')
+        self.window.after(0, self.end_conversion_ui, directory)
 
-        # Start timer for status deletion.
-        Thread(target=self.reset_dl_status).start()
-        webbrowser.open(os.path.realpath(directory))
-        self.status_text.config(text="Done!")
+    def open_directory(self, directory: str):
+        """
+        Opens the directory in the system file manager without waiting for it.
+        Falls back to the web browser module if the file manager cannot be started.
+
+        Args:
+            directory (str): Directory to open.
+        """
+        try:
+            if sys.platform == 'win32':
+                os.startfile(directory)
+            else:
+                # Imported here so that starting the app does not load subprocess.
+                import subprocess
+
+                opener = 'open' if sys.platform == 'darwin' else 'xdg-open'
+                subprocess.Popen([opener, directory], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        except OSError:
+            import webbrowser
+            webbrowser.open(directory)
+
+    def begin_conversion_ui(self):
+        """
+        Starts the progress bar and locks the widgets. Runs on the main thread.
+        """
+        # A reset left over from the previous conversion would clear this one's status.
+        if self.status_reset_id is not None:
+            self.window.after_cancel(self.status_reset_id)
+            self.status_reset_id = None
+        self.pb.start()
+        self.schedule_ui_update(self.status_text, text="Converting...")
+        self.change_widgets('off')
+
+    def end_conversion_ui(self, directory: str):
+        """
+        Stops the progress bar, unlocks the widgets, and starts the timer for status deletion.
+        Opens the output directory if enabled. Runs on the main thread.
+
+        Args:
+            directory (str): Directory where the files were saved.
+        """
         self.pb.stop()
+        self.change_widgets('on')
+        self.schedule_ui_update(self.status_text, text="Done!")
+        self.status_reset_id = self.window.after(STATUS_RESET_MS, self.reset_dl_status)
+        if self.open_folder.get():
+            self.open_directory(os.path.abspath(directory))
 
     def reset_dl_status(self):
         """
         Resets the download status.
         """
-        time.sleep(5)
-        self.download_status.config(text='')
-        self.status_text.config(text = 'Idle')
+        self.status_reset_id = None
+        self.schedule_ui_update(self.download_status, text='')
+        self.schedule_ui_update(self.status_text, text='Idle')
 
     def get_dir(self):
         """
         Asks for the directory. This will be used as a location to save the MP3 or MP4 files.
         """
+        # Start the dialog in the current directory; the isdir check is skipped when the entry is empty.
+        current = self.in_directory.get()
+        options = {'initialdir': current} if current and os.path.isdir(current) else {}
         self.in_directory.delete('0', tk.END)
-        file_location = filedialog.askdirectory()
+        file_location = filedialog.askdirectory(**options)
         self.in_directory.insert(0, file_location)
         return file_location
 
@@ -341,6 +850,15 @@ class GUI:
         """
         self.window.resizable(False, False)
         self.window.mainloop()
+        self.task_pool.shutdown(wait=False, cancel_futures=True)
+        self.size_pool.shutdown(wait=False, cancel_futures=True)
+        self.convert_pool.shutdown(wait=False, cancel_futures=True)
+        # Size lookups may still be running, so close the shelf under the lock and leave them
+        # a plain dict to write to.
+        with self.size_cache_lock:
+            if isinstance(self.size_cache, shelve.Shelf):
+                self.size_cache.close()
+            self.size_cache = {}
 
 if __name__ == '__main__':
     GUI().run()
\ No newline at end of file